@@ -32,10 +32,10 @@ class CutImageResult: ObservableObject, Identifiable {
 
     var hasGeneratedPieces: Bool { !pieces.isEmpty }
 
-    /// Removes the temp output directory from disk.
+    /// Removes the temp output directory from disk (in the background).
     func cleanupOutputDirectory() {
         guard let dir = outputDirectory else { return }
-        try? FileManager.default.removeItem(at: dir)
+        ProjectStore.removeInBackground(dir)
         outputDirectory = nil
     }
 }
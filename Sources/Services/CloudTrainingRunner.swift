@@ -50,8 +50,8 @@ enum CloudTrainingRunner {
                 arguments: args,
                 workingDirectory: nil,
                 environment: [:],
-                onStdoutLine: { _ in },
-                onStderrLine: { _ in }
+                onStdoutLine: nil,
+                onStderrLine: nil
             )
             if exitCode == 0 {
                 return (true, "Connection successful")
@@ -143,7 +143,7 @@ enum CloudTrainingRunner {
                 arguments: sshFlags(config) + [remote, "echo ok"],
                 workingDirectory: nil,
                 environment: [:],
-                onStdoutLine: { _ in },
+                onStdoutLine: nil,
                 onStderrLine: { line in
                     Task { @MainActor in state.appendLog("[ssh] \(line)") }
                 }
@@ -166,7 +166,7 @@ enum CloudTrainingRunner {
                 arguments: sshFlags(config) + [remote, "mkdir -p \(remoteDir)"],
                 workingDirectory: nil,
                 environment: [:],
-                onStdoutLine: { _ in },
+                onStdoutLine: nil,
                 onStderrLine: { line in
                     Task { @MainActor in state.appendLog("[ssh] \(line)") }
                 }
@@ -201,7 +201,7 @@ enum CloudTrainingRunner {
                 onStdoutLine: { line in
                     captured.value = line.trimmingCharacters(in: .whitespaces)
                 },
-                onStderrLine: { _ in }
+                onStderrLine: nil
             )
             let remoteCountStr = captured.value
             if exitCode == 0, let remoteCount = Int(remoteCountStr), remoteCount >= localFileCount {
@@ -228,8 +228,8 @@ enum CloudTrainingRunner {
                     arguments: sshFlags(config) + [remote, "find \(remoteDatasetCache) -name '._*' -delete 2>/dev/null; mkdir -p \(remoteDatasetCache)"],
                     workingDirectory: nil,
                     environment: [:],
-                    onStdoutLine: { _ in },
-                    onStderrLine: { _ in }
+                    onStdoutLine: nil,
+                    onStderrLine: nil
                 )
 
                 // tar|ssh pipeline: single stream, much faster than scp -r per-file.
@@ -253,7 +253,7 @@ enum CloudTrainingRunner {
                             onStdoutLine: { line in
                                 captured.value = line.trimmingCharacters(in: .whitespaces)
                             },
-                            onStderrLine: { _ in }
+                            onStderrLine: nil
                         )
                         if let count = Int(captured.value), count > 0 {
                             let pct = localFileCount > 0 ? Int(Double(count) / Double(localFileCount) * 100) : 0
@@ -269,8 +269,8 @@ enum CloudTrainingRunner {
                     arguments: ["-c", tarPipeline],
                     workingDirectory: nil,
                     environment: [:],
-                    onStdoutLine: { _ in },
-                    onStderrLine: { _ in }
+                    onStdoutLine: nil,
+                    onStderrLine: nil
                 )
 
                 progressTask.cancel()
@@ -293,7 +293,7 @@ enum CloudTrainingRunner {
                 arguments: sshFlags(config) + [remote, "ln -sfn \(remoteDatasetCache) \(remoteDatasetLink)"],
                 workingDirectory: nil,
                 environment: [:],
-                onStdoutLine: { _ in },
+                onStdoutLine: nil,
                 onStderrLine: { line in
                     Task { @MainActor in state.appendLog("[ssh] \(line)") }
                 }
@@ -317,7 +317,7 @@ enum CloudTrainingRunner {
                 arguments: scpFlags(config) + [trainPy, reqTxt, "\(remote):\(remoteDir)/"],
                 workingDirectory: nil,
                 environment: [:],
-                onStdoutLine: { _ in },
+                onStdoutLine: nil,
                 onStderrLine: { line in
                     Task { @MainActor in state.appendLog("[scp] \(line)") }
                 }
@@ -415,7 +415,7 @@ enum CloudTrainingRunner {
                 arguments: scpFlags(config) + ["\(remote):\(remoteDir)/metrics.json", localResultsDir.path + "/"],
                 workingDirectory: nil,
                 environment: [:],
-                onStdoutLine: { _ in },
+                onStdoutLine: nil,
                 onStderrLine: { line in
                     Task { @MainActor in state.appendLog("[scp] \(line)") }
                 }
@@ -438,8 +438,8 @@ enum CloudTrainingRunner {
                 arguments: scpFlags(config) + ["-r", "\(remote):\(remoteDir)/model.mlpackage", localResultsDir.path + "/"],
                 workingDirectory: nil,
                 environment: [:],
-                onStdoutLine: { _ in },
-                onStderrLine: { _ in }
+                onStdoutLine: nil,
+                onStderrLine: nil
             )
             if exitCode == 0 {
                 await MainActor.run { state.appendLog("Downloaded model.mlpackage") }
@@ -534,14 +534,15 @@ enum CloudTrainingRunner {
     // MARK: - Subprocess Runner
 
     /// Run a process and stream stdout/stderr line by line.
+    /// A nil handler sends that stream to /dev/null instead of piping and line-splitting it.
     /// Independent copy from TrainingRunner to keep the two runners decoupled.
     private static func runProcess(
         executable: String,
         arguments: [String],
         workingDirectory: URL?,
         environment: [String: String],
-        onStdoutLine: @escaping @Sendable (String) -> Void,
-        onStderrLine: @escaping @Sendable (String) -> Void
+        onStdoutLine: (@Sendable (String) -> Void)?,
+        onStderrLine: (@Sendable (String) -> Void)?
     ) async throws -> Int32 {
         try await withCheckedThrowingContinuation { continuation in
             let process = Process()
@@ -554,37 +555,14 @@ enum CloudTrainingRunner {
                 process.environment = environment
             }
 
-            let stdoutPipe = Pipe()
-            let stderrPipe = Pipe()
-            process.standardOutput = stdoutPipe
-            process.standardError = stderrPipe
-
-            let stdoutBuffer = LineBuffer { line in onStdoutLine(line) }
-            let stderrBuffer = LineBuffer { line in onStderrLine(line) }
-
-            stdoutPipe.fileHandleForReading.readabilityHandler = { handle in
-                let data = handle.availableData
-                if data.isEmpty {
-                    stdoutBuffer.flush()
-                    stdoutPipe.fileHandleForReading.readabilityHandler = nil
-                } else {
-                    stdoutBuffer.append(data)
-                }
-            }
-
-            stderrPipe.fileHandleForReading.readabilityHandler = { handle in
-                let data = handle.availableData
-                if data.isEmpty {
-                    stderrBuffer.flush()
-                    stderrPipe.fileHandleForReading.readabilityHandler = nil
-                } else {
-                    stderrBuffer.append(data)
-                }
-            }
+            let stdout = outputDestination(onLine: onStdoutLine)
+            let stderr = outputDestination(onLine: onStderrLine)
+            process.standardOutput = stdout.handle
+            process.standardError = stderr.handle
 
             process.terminationHandler = { proc in
-                stdoutBuffer.flush()
-                stderrBuffer.flush()
+                stdout.buffer?.flush()
+                stderr.buffer?.flush()
                 currentProcess = nil
                 continuation.resume(returning: proc.terminationStatus)
             }
@@ -599,6 +577,27 @@ enum CloudTrainingRunner {
         }
     }
 
+    /// Build the destination for one process output stream: a pipe feeding a line
+    /// buffer when there's a handler, otherwise the null device.
+    private static func outputDestination(
+        onLine: (@Sendable (String) -> Void)?
+    ) -> (handle: Any, buffer: LineBuffer?) {
+        guard let onLine else { return (FileHandle.nullDevice, nil) }
+
+        let pipe = Pipe()
+        let buffer = LineBuffer { line in onLine(line) }
+        pipe.fileHandleForReading.readabilityHandler = { handle in
+            let data = handle.availableData
+            if data.isEmpty {
+                buffer.flush()
+                pipe.fileHandleForReading.readabilityHandler = nil
+            } else {
+                buffer.append(data)
+            }
+        }
+        return (pipe, buffer)
+    }
+
     // MARK: - Helpers
 
     /// Thread-safe container for capturing a single line from a process callback.
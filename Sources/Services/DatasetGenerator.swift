@@ -168,14 +168,10 @@ enum DatasetGenerator {
                     for piece in genResult.pieces {
                         guard let sourcePath = piece.imagePath else { continue }
                         let destPath = pieceDir.appendingPathComponent("piece_\(piece.pieceIndex).png")
-                        do {
-                            if FileManager.default.fileExists(atPath: destPath.path) {
-                                try FileManager.default.removeItem(at: destPath)
-                            }
-                            try FileManager.default.moveItem(at: sourcePath, to: destPath)
-                        } catch {
-                            try? FileManager.default.copyItem(at: sourcePath, to: destPath)
+                        if FileManager.default.fileExists(atPath: destPath.path) {
+                            try? FileManager.default.removeItem(at: destPath)
                         }
+                        try? ProjectStore.transferFile(at: sourcePath, to: destPath)
                         pieces.append(DatasetPiece(
                             imageID: imageID,
                             cutIndex: cutIndex,
@@ -134,19 +134,22 @@ enum ProjectStore {
 
         var projects: [PuzzleProject] = []
 
+        // One decoder for every manifest; manifests list every piece of every cut
+        let decoder = JSONDecoder()
+        decoder.dateDecodingStrategy = .iso8601
+
+        // Prefetch the directory flag with the listing so entries need no extra stat
         guard let contents = try? fm.contentsOfDirectory(
             at: projectsDir,
-            includingPropertiesForKeys: nil,
+            includingPropertiesForKeys: [.isDirectoryKey],
             options: .skipsHiddenFiles
         ) else { return [] }
 
         for dir in contents {
+            guard (try? dir.resourceValues(forKeys: [.isDirectoryKey]))?.isDirectory == true else { continue }
+            // A missing manifest just fails the read, so no separate existence check
             let manifestURL = dir.appendingPathComponent("manifest.json")
-            guard fm.fileExists(atPath: manifestURL.path) else { continue }
-            guard let data = try? Data(contentsOf: manifestURL) else { continue }
-
-            let decoder = JSONDecoder()
-            decoder.dateDecodingStrategy = .iso8601
+            guard let data = try? Data(contentsOf: manifestURL, options: .mappedIfSafe) else { continue }
             guard let manifest = try? decoder.decode(ProjectManifest.self, from: data) else { continue }
 
             let project = PuzzleProject(
@@ -194,6 +197,9 @@ enum ProjectStore {
                         imageID: resultManifest.imageID
                     )
 
+                    // List the pieces directory once instead of stat-ing every piece
+                    let pieceFilenames = Set((try? fm.contentsOfDirectory(atPath: cutPiecesDir.path)) ?? [])
+
                     imageResult.pieces = resultManifest.pieces.map { pm in
                         let piecePath = cutPiecesDir.appendingPathComponent(pm.imageFilename)
                         return PuzzlePiece(
@@ -207,7 +213,7 @@ enum ProjectStore {
                             pieceHeight: pm.pieceHeight,
                             pieceType: pm.pieceType,
                             neighbourIDs: pm.neighbourIDs,
-                            imagePath: fm.fileExists(atPath: piecePath.path) ? piecePath : nil
+                            imagePath: pieceFilenames.contains(pm.imageFilename) ? piecePath : nil
                         )
                     }
 
@@ -261,6 +267,14 @@ enum ProjectStore {
         try? FileManager.default.removeItem(at: dir)
     }
 
+    /// Removes a temp directory off the calling thread, so callers on the main actor
+    /// don't wait for every file in it to be unlinked.
+    static func removeInBackground(_ dir: URL) {
+        Task.detached(priority: .background) {
+            try? FileManager.default.removeItem(at: dir)
+        }
+    }
+
     // MARK: - File Operations
 
     @MainActor
@@ -321,6 +335,28 @@ enum ProjectStore {
         let permanentDir = piecesDirectory(projectID: project.id, cutID: cutID, imageID: imageResult.imageID)
         let fm = FileManager.default
 
+        // Fast path: a fresh cut image takes the whole temp pieces directory in one rename
+        let tempPiecesDir = tempDir.appendingPathComponent("pieces")
+        if !fm.fileExists(atPath: permanentDir.path),
+           imageResult.pieces.allSatisfy({ $0.imagePath?.deletingLastPathComponent().path == tempPiecesDir.path }) {
+            do {
+                try fm.createDirectory(
+                    at: permanentDir.deletingLastPathComponent(),
+                    withIntermediateDirectories: true
+                )
+                try fm.moveItem(at: tempPiecesDir, to: permanentDir)
+                imageResult.pieces = imageResult.pieces.map { piece in
+                    guard let sourcePath = piece.imagePath else { return piece }
+                    return relocated(piece, to: permanentDir.appendingPathComponent(sourcePath.lastPathComponent))
+                }
+                removeInBackground(tempDir)
+                imageResult.outputDirectory = nil
+                return
+            } catch {
+                // Fall back to moving pieces one at a time
+            }
+        }
+
         do {
             try fm.createDirectory(at: permanentDir, withIntermediateDirectories: true)
         } catch {
@@ -328,54 +364,82 @@ enum ProjectStore {
             return
         }
 
-        var updatedPieces: [PuzzlePiece] = []
-        for piece in imageResult.pieces {
-            guard let sourcePath = piece.imagePath else {
-                updatedPieces.append(piece)
-                continue
-            }
+        // Resolve every destination first, then run the file transfers concurrently
+        let pieces = imageResult.pieces
+        let transfers: [(source: URL, destination: URL)?] = pieces.map { piece in
+            guard let sourcePath = piece.imagePath else { return nil }
+            let destURL = permanentDir.appendingPathComponent(sourcePath.lastPathComponent)
+            return sourcePath.path == destURL.path ? nil : (source: sourcePath, destination: destURL)
+        }
 
-            let filename = sourcePath.lastPathComponent
-            let destURL = permanentDir.appendingPathComponent(filename)
+        var transferred = [Bool](repeating: false, count: pieces.count)
+        transferred.withUnsafeMutableBufferPointer { results in
+            DispatchQueue.concurrentPerform(iterations: transfers.count) { i in
+                guard let transfer = transfers[i] else { return }
+                let fm = FileManager.default
+                do {
+                    if fm.fileExists(atPath: transfer.destination.path) {
+                        try fm.removeItem(at: transfer.destination)
+                    }
+                    try transferFile(at: transfer.source, to: transfer.destination)
+                    results[i] = true
+                } catch {
+                    print("ProjectStore: Failed to move piece \(transfer.source.lastPathComponent): \(error)")
+                }
+            }
+        }
 
-            if sourcePath.path == destURL.path {
+        var updatedPieces: [PuzzlePiece] = []
+        updatedPieces.reserveCapacity(pieces.count)
+        for (i, piece) in pieces.enumerated() {
+            guard transferred[i], let destURL = transfers[i]?.destination else {
                 updatedPieces.append(piece)
                 continue
             }
 
-            do {
-                if fm.fileExists(atPath: destURL.path) {
-                    try fm.removeItem(at: destURL)
-                }
-                try fm.copyItem(at: sourcePath, to: destURL)
-
-                let updated = PuzzlePiece(
-                    id: piece.id,
-                    pieceIndex: piece.pieceIndex,
-                    row: piece.row,
-                    col: piece.col,
-                    x1: piece.x1, y1: piece.y1,
-                    x2: piece.x2, y2: piece.y2,
-                    pieceWidth: piece.pieceWidth,
-                    pieceHeight: piece.pieceHeight,
-                    pieceType: piece.pieceType,
-                    neighbourIDs: piece.neighbourIDs,
-                    imagePath: destURL
-                )
-                updatedPieces.append(updated)
-            } catch {
-                print("ProjectStore: Failed to copy piece \(filename): \(error)")
-                updatedPieces.append(piece)
-            }
+            updatedPieces.append(relocated(piece, to: destURL))
         }
 
         imageResult.pieces = updatedPieces
 
         // Clean up temp directory
-        try? fm.removeItem(at: tempDir)
+        removeInBackground(tempDir)
         imageResult.outputDirectory = nil
     }
 
+    /// Returns a copy of the piece pointing at its new image location.
+    private static func relocated(_ piece: PuzzlePiece, to imagePath: URL) -> PuzzlePiece {
+        PuzzlePiece(
+            id: piece.id,
+            pieceIndex: piece.pieceIndex,
+            row: piece.row,
+            col: piece.col,
+            x1: piece.x1, y1: piece.y1,
+            x2: piece.x2, y2: piece.y2,
+            pieceWidth: piece.pieceWidth,
+            pieceHeight: piece.pieceHeight,
+            pieceType: piece.pieceType,
+            neighbourIDs: piece.neighbourIDs,
+            imagePath: imagePath
+        )
+    }
+
+    /// Moves a generated file out of a temp directory. The temp directory is deleted
+    /// afterwards, so a rename is enough; falls back to a hard link, then a full copy.
+    /// Shared with DatasetGenerator, which persists generated pieces the same way.
+    static func transferFile(at source: URL, to destination: URL) throws {
+        let fm = FileManager.default
+        do {
+            try fm.moveItem(at: source, to: destination)
+        } catch {
+            do {
+                try fm.linkItem(at: source, to: destination)
+            } catch {
+                try fm.copyItem(at: source, to: destination)
+            }
+        }
+    }
+
     /// Saves the lines overlay image to the image result's permanent directory.
     @MainActor
     static func saveLinesOverlay(for imageResult: CutImageResult, cutID: UUID, in project: PuzzleProject) {
@@ -391,14 +455,10 @@ enum ProjectStore {
             return
         }
 
-        if let tiffData = linesImage.tiffRepresentation,
-           let bitmap = NSBitmapImageRep(data: tiffData),
-           let pngData = bitmap.representation(using: .png, properties: [:]) {
-            do {
-                try pngData.write(to: linesURL)
-            } catch {
-                print("ProjectStore: Failed to save lines overlay: \(error)")
-            }
+        do {
+            try writePNG(linesImage, to: linesURL)
+        } catch {
+            print("ProjectStore: Failed to save lines overlay: \(error)")
         }
     }
 
@@ -417,14 +477,26 @@ enum ProjectStore {
             return
         }
 
-        if let tiffData = normImage.tiffRepresentation,
-           let bitmap = NSBitmapImageRep(data: tiffData),
-           let pngData = bitmap.representation(using: .png, properties: [:]) {
-            do {
-                try pngData.write(to: normURL)
-            } catch {
-                print("ProjectStore: Failed to save normalised source: \(error)")
-            }
+        do {
+            try writePNG(normImage, to: normURL)
+        } catch {
+            print("ProjectStore: Failed to save normalised source: \(error)")
+        }
+    }
+
+    /// Writes an NSImage as PNG. Images backed by a CGImage (everything the generator
+    /// produces) are encoded directly, skipping the TIFF encode/decode round-trip.
+    private static func writePNG(_ image: NSImage, to url: URL) throws {
+        if let cgImage = image.cgImage(forProposedRect: nil, context: nil, hints: nil) {
+            try PieceClipper.writePNG(cgImage, to: url)
+            return
+        }
+
+        guard let tiffData = image.tiffRepresentation,
+              let bitmap = NSBitmapImageRep(data: tiffData),
+              let pngData = bitmap.representation(using: .png, properties: [:]) else {
+            throw PieceClipper.ClipError.pngWriteFailed(url.lastPathComponent)
         }
+        try pngData.write(to: url)
     }
 }
@@ -1,8 +1,9 @@
+import Accelerate
 import CoreGraphics
 
-/// Handles image upscaling for small source images.
+/// Handles image scaling for small source images.
 /// Small images produce jagged bezier curves when clipped at low resolution,
-/// so we upscale them before processing (matching piecemaker's behaviour).
+/// so we clip them at a larger size (matching piecemaker's behaviour).
 enum ImageScaler {
 
     /// Minimum pixels on the longest side. Images below this are upscaled.
@@ -44,49 +45,80 @@ enum ImageScaler {
         // Already correct size
         if image.width == width && image.height == height { return image }
 
-        guard let context = CGContext(
-            data: nil,
-            width: width,
-            height: height,
+        return lanczosScale(image, toWidth: width, height: height)
+            ?? contextScale(image, toWidth: width, height: height)
+            ?? image
+    }
+
+    /// Working dimensions for an image whose longest side is below the minimum threshold.
+    /// Pieces are clipped at this size, with the source scaled on the fly while drawing,
+    /// so no upscaled copy of the whole image is rasterised.
+    /// Returns the original dimensions if the image is already large enough.
+    static func upscaledSize(width: Int, height: Int) -> (width: Int, height: Int) {
+        let longest = max(width, height)
+        guard longest > 0, longest < minLongSide else { return (width, height) }
+
+        let scale = CGFloat(minLongSide) / CGFloat(longest)
+        return (Int(CGFloat(width) * scale), Int(CGFloat(height) * scale))
+    }
+
+    // MARK: - Private Helpers
+
+    /// Scale with vImage's SIMD Lanczos kernel (kvImageHighQualityResampling).
+    /// Returns nil if the image can't be converted to 8-bit RGBA, so callers
+    /// can fall back to Core Graphics.
+    private static func lanczosScale(_ image: CGImage, toWidth width: Int, height: Int) -> CGImage? {
+        let colourSpace = image.colorSpace.flatMap { $0.model == .rgb ? $0 : nil }
+            ?? CGColorSpaceCreateDeviceRGB()
+        guard let format = vImage_CGImageFormat(
             bitsPerComponent: 8,
-            bytesPerRow: 0,
-            space: image.colorSpace ?? CGColorSpaceCreateDeviceRGB(),
-            bitmapInfo: CGImageAlphaInfo.premultipliedLast.rawValue
+            bitsPerPixel: 32,
+            colorSpace: colourSpace,
+            bitmapInfo: CGBitmapInfo(rawValue: CGImageAlphaInfo.premultipliedLast.rawValue)
         ) else {
-            return image
+            return nil
         }
 
-        context.interpolationQuality = .high
-        context.draw(image, in: CGRect(x: 0, y: 0, width: width, height: height))
-        return context.makeImage() ?? image
-    }
-
-    /// Upscale the image if its longest side is below the minimum threshold.
-    /// Uses high-quality interpolation (matching Python's Image.LANCZOS).
-    /// Returns the original image unchanged if it's already large enough.
-    static func upscaleIfNeeded(_ image: CGImage) -> CGImage {
-        let longest = max(image.width, image.height)
-        guard longest < minLongSide else { return image }
+        guard var source = try? vImage_Buffer(cgImage: image, format: format) else { return nil }
+        defer { source.free() }
 
-        let scale = CGFloat(minLongSide) / CGFloat(longest)
-        let newWidth = Int(CGFloat(image.width) * scale)
-        let newHeight = Int(CGFloat(image.height) * scale)
+        guard var destination = try? vImage_Buffer(
+            width: width,
+            height: height,
+            bitsPerPixel: format.bitsPerPixel
+        ) else {
+            return nil
+        }
+        defer { destination.free() }
+
+        // Channel order is irrelevant to scaling, so the ARGB8888 variant handles RGBA too
+        let error = vImageScale_ARGB8888(
+            &source,
+            &destination,
+            nil,
+            vImage_Flags(kvImageHighQualityResampling)
+        )
+        guard error == kvImageNoError else { return nil }
+
+        return try? destination.createCGImage(format: format)
+    }
 
+    /// Scale by drawing into a bitmap context (fallback when vImage can't be used).
+    private static func contextScale(_ image: CGImage, toWidth width: Int, height: Int) -> CGImage? {
         guard let context = CGContext(
             data: nil,
-            width: newWidth,
-            height: newHeight,
+            width: width,
+            height: height,
             bitsPerComponent: 8,
             bytesPerRow: 0,
             space: image.colorSpace ?? CGColorSpaceCreateDeviceRGB(),
             bitmapInfo: CGImageAlphaInfo.premultipliedLast.rawValue
         ) else {
-            return image
+            return nil
         }
 
         context.interpolationQuality = .high
-        context.draw(image, in: CGRect(x: 0, y: 0, width: newWidth, height: newHeight))
-
-        return context.makeImage() ?? image
+        context.draw(image, in: CGRect(x: 0, y: 0, width: width, height: height))
+        return context.makeImage()
     }
 }
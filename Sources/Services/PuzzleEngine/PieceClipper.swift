@@ -20,11 +20,11 @@ enum PieceClipper {
     /// Clip the source image to the given piece path and save as a transparent PNG.
     ///
     /// - Parameters:
-    ///   - sourceImage: The full source image.
+    ///   - sourceImage: The full source image, scaled to `imageWidth` x `imageHeight` when drawn.
     ///   - piecePath: A closed CGPath in image pixel coordinates (y=0 at top).
     ///   - outputURL: Where to write the piece PNG.
-    ///   - imageWidth: Source image width in pixels.
-    ///   - imageHeight: Source image height in pixels.
+    ///   - imageWidth: Working image width in pixels.
+    ///   - imageHeight: Working image height in pixels.
     /// - Returns: The piece's bounding box and dimensions.
     static func clipAndSave(
         sourceImage: CGImage,
@@ -69,6 +69,7 @@ enum PieceClipper {
         // Clip to the piece path and draw the source image
         context.addPath(piecePath)
         context.clip()
+        context.interpolationQuality = .high
         context.draw(
             sourceImage,
             in: CGRect(x: 0, y: 0, width: imageWidth, height: imageHeight)
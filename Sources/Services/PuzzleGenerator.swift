@@ -67,20 +67,26 @@ actor PuzzleGenerator {
 
         onProgress(0.05)
 
-        // Prepare working image: normalise or upscale
+        // Prepare working image and the pixel dimensions pieces are clipped at
         let workingImage: CGImage
+        let imageWidth: Int
+        let imageHeight: Int
         if let pieceSize = config.pieceSize {
             // AI normalisation: crop to grid aspect ratio, resize to exact dimensions
             let cropped = ImageScaler.cropToAspectRatio(sourceImage, cols: cols, rows: rows)
             let targetWidth = cols * pieceSize
             let targetHeight = rows * pieceSize
             workingImage = ImageScaler.resize(cropped, toWidth: targetWidth, height: targetHeight)
+            imageWidth = workingImage.width
+            imageHeight = workingImage.height
         } else {
-            // Standard path: upscale small images for smooth bezier edges
-            workingImage = ImageScaler.upscaleIfNeeded(sourceImage)
+            // Standard path: clip small images at a larger size for smooth bezier edges.
+            // The source is scaled as each piece is drawn, so no upscaled copy is made.
+            workingImage = sourceImage
+            let size = ImageScaler.upscaledSize(width: sourceImage.width, height: sourceImage.height)
+            imageWidth = size.width
+            imageHeight = size.height
         }
-        let imageWidth = workingImage.width
-        let imageHeight = workingImage.height
 
         // Compute cell dimensions
         let cellWidth = CGFloat(imageWidth) / CGFloat(cols)
@@ -122,7 +128,14 @@ actor PuzzleGenerator {
         var pieces: [PuzzlePiece] = []
         pieces.reserveCapacity(totalPieces)
 
+        // Loop-invariant grid bounds
+        let lastRow = rows - 1
+        let lastCol = cols - 1
+
         for row in 0..<rows {
+            // Border count contributed by the row, shared by every piece in it
+            let rowBorders = (row == 0 ? 1 : 0) + (row == lastRow ? 1 : 0)
+
             for col in 0..<cols {
                 let pieceIndex = row * cols + col
 
@@ -156,12 +169,8 @@ actor PuzzleGenerator {
                     ))
                 }
 
-                // Compute piece type from grid position
-                let isTop = (row == 0)
-                let isBottom = (row == rows - 1)
-                let isLeft = (col == 0)
-                let isRight = (col == cols - 1)
-                let borderCount = [isTop, isBottom, isLeft, isRight].filter { $0 }.count
+                // Compute piece type from grid position (no per-piece array allocation)
+                let borderCount = rowBorders + (col == 0 ? 1 : 0) + (col == lastCol ? 1 : 0)
 
                 let pieceType: PieceType
                 if borderCount >= 2 {
@@ -175,9 +184,9 @@ actor PuzzleGenerator {
                 // Compute neighbours (trivial on a grid)
                 var neighbourIDs: [Int] = []
                 if row > 0 { neighbourIDs.append((row - 1) * cols + col) }
-                if row < rows - 1 { neighbourIDs.append((row + 1) * cols + col) }
-                if col > 0 { neighbourIDs.append(row * cols + (col - 1)) }
-                if col < cols - 1 { neighbourIDs.append(row * cols + (col + 1)) }
+                if row < lastRow { neighbourIDs.append((row + 1) * cols + col) }
+                if col > 0 { neighbourIDs.append(pieceIndex - 1) }
+                if col < lastCol { neighbourIDs.append(pieceIndex + 1) }
 
                 let piece = PuzzlePiece(
                     id: UUID(),
@@ -841,15 +841,16 @@ struct DatasetDetailView: View {
                 .appendingPathComponent(category.rawValue)
             guard fm.fileExists(atPath: catDir.path) else { continue }
 
-            // Find pair files
-            guard let files = try? fm.contentsOfDirectory(at: catDir, includingPropertiesForKeys: nil)
-                .filter({ $0.lastPathComponent.hasSuffix("_left.png") })
-                .sorted(by: { $0.lastPathComponent < $1.lastPathComponent })
+            // Find pair files, sorting plain filenames so the key isn't re-derived from a URL on every comparison
+            guard let leftNames = try? fm.contentsOfDirectory(atPath: catDir.path)
+                .filter({ $0.hasSuffix("_left.png") })
+                .sorted()
             else { continue }
 
-            for leftFile in files.prefix(2) {
+            for leftName in leftNames.prefix(2) {
+                let leftFile = catDir.appendingPathComponent(leftName)
                 let rightFile = catDir.appendingPathComponent(
-                    leftFile.lastPathComponent.replacingOccurrences(of: "_left.png", with: "_right.png")
+                    leftName.replacingOccurrences(of: "_left.png", with: "_right.png")
                 )
                 guard fm.fileExists(atPath: rightFile.path),
                       let leftImage = NSImage(contentsOf: leftFile),
@@ -879,14 +880,16 @@ struct DatasetDetailView: View {
                 .appendingPathComponent(category.rawValue)
             guard fm.fileExists(atPath: catDir.path) else { continue }
 
-            guard let files = try? fm.contentsOfDirectory(at: catDir, includingPropertiesForKeys: nil)
-                .filter({ $0.lastPathComponent.hasSuffix("_left.png") })
-                .sorted(by: { $0.lastPathComponent < $1.lastPathComponent })
+            // Sort plain filenames so the key isn't re-derived from a URL on every comparison
+            guard let leftNames = try? fm.contentsOfDirectory(atPath: catDir.path)
+                .filter({ $0.hasSuffix("_left.png") })
+                .sorted()
             else { continue }
 
-            for leftFile in files {
+            for leftName in leftNames {
+                let leftFile = catDir.appendingPathComponent(leftName)
                 let rightFile = catDir.appendingPathComponent(
-                    leftFile.lastPathComponent.replacingOccurrences(of: "_left.png", with: "_right.png")
+                    leftName.replacingOccurrences(of: "_left.png", with: "_right.png")
                 )
                 guard fm.fileExists(atPath: rightFile.path) else { continue }
 